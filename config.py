@@ -4,15 +4,24 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:
     import yaml
 except ImportError:
     yaml = None
+else:
+    # Prefer the libyaml-backed C implementations when available.
+    try:
+        from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+    except ImportError:
+        from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
 
 CONFIG_FILE = "config.yaml"
 
+# Parsed config keyed by (path, mtime_ns, size) so unchanged files are not re-parsed.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
 
 def config_exists() -> bool:
     """Check if configuration file exists."""
@@ -25,19 +34,34 @@ def load_config() -> Optional[Dict[str, Any]]:
     Returns:
         Configuration dictionary or None if file doesn't exist or is invalid.
     """
-    if not config_exists():
-        return None
-    
     if yaml is None:
         return None
-        
+
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+
+    key = (CONFIG_FILE, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        with open(CONFIG_FILE, "r") as f:
-            config = yaml.safe_load(f)
-            return config if config else None
+        # Hand raw bytes to the loader; libyaml decodes them itself.
+        with open(CONFIG_FILE, "rb") as f:
+            data = f.read()
+        config = yaml.load(data, Loader=_Loader)
     except Exception:
         return None
 
+    if not config:
+        return None
+
+    _CONFIG_CACHE.clear()
+    _CONFIG_CACHE[key] = config
+    return config
+
 
 def save_config(
     url: str,
@@ -73,11 +97,13 @@ def save_config(
         config_data["portainer"]["auth"]["username"] = username
         config_data["portainer"]["auth"]["method"] = "username_password"
     
+    _CONFIG_CACHE.clear()
     with open(CONFIG_FILE, "w") as f:
-        yaml.safe_dump(config_data, f, sort_keys=False, default_flow_style=False)
+        yaml.dump(config_data, f, Dumper=_Dumper, sort_keys=False, default_flow_style=False)
 
 
 def delete_config() -> None:
     """Delete the configuration file."""
+    _CONFIG_CACHE.clear()
     if config_exists():
         os.remove(CONFIG_FILE)
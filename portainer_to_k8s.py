@@ -4,21 +4,83 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional
-
-import requests
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 try:
     import yaml
 except ImportError:  # pragma: no cover - optional dependency
     yaml = None
+else:
+    try:
+        from yaml import CSafeDumper as _BaseDumper
+    except ImportError:  # pragma: no cover - libyaml not available
+        from yaml import SafeDumper as _BaseDumper
+
+    class _Dumper(_BaseDumper):
+        """Safe dumper that writes shared sub-dicts inline instead of as anchors."""
+
+        def ignore_aliases(self, data: Any) -> bool:
+            return True
+
+
+_CONTAINER_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]+")
+_SANITIZE_RE = re.compile(r"[^a-z0-9-]+")
+# Maps every Latin-1 character outside [a-z0-9-] to "-" for the ASCII fast path.
+_SANITIZE_TABLE = str.maketrans(
+    {c: "-" for c in map(chr, range(256)) if not ("a" <= c <= "z" or "0" <= c <= "9" or c == "-")}
+)
+
+
+def __getattr__(name: str) -> Any:
+    # ``requests`` is imported lazily; keep ``portainer_to_k8s.requests`` resolvable.
+    if name == "requests":
+        import requests
+
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _json_parsers() -> Tuple[Callable[[bytes], Any], Any]:
+    """Return ``(loads, ijson)`` using the fastest parsers that are installed.
+
+    Imported on first use, like ``requests``, so that --help and TUI startup
+    don't pay for them. ``ijson`` is None when it is missing or only has its
+    pure-Python backend, which is slower than a full ``loads`` of the body.
+    """
+    try:
+        from orjson import loads
+    except ImportError:  # pragma: no cover - optional dependency
+        from json import loads
+
+    try:
+        import ijson
+    except ImportError:  # pragma: no cover - optional dependency
+        ijson = None
+    else:
+        if ijson.backend == "python":
+            ijson = None
+
+    return loads, ijson
 
 
 class PortainerClient:
     """Small helper around the Portainer API."""
 
+    __slots__ = (
+        "base_url",
+        "session",
+        "_requests",
+        "_json_loads",
+        "_ijson",
+        "_endpoint_id",
+        "_containers_url",
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -30,9 +92,31 @@ class PortainerClient:
         if not base_url.startswith(("http://", "https://")):
             raise ValueError("Portainer URL must include http:// or https://")
 
+        # Deferred so that --help and TUI startup don't pay for importing requests.
+        import requests
+        from urllib3.util import Retry
+
+        self._requests = requests
+        self._json_loads, self._ijson = _json_parsers()
         self.base_url = base_url.rstrip("/")
         self.endpoint_id = endpoint_id
         self.session = requests.Session()
+        # Keep-alive connections (and their TLS sessions) are reused across calls;
+        # the pool is sized for the TUI's concurrent background fetches.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+        )
 
         if api_key:
             self.session.headers["X-API-Key"] = api_key
@@ -42,6 +126,17 @@ class PortainerClient:
         else:
             raise ValueError("Provide either an API key or username/password for Portainer")
 
+    @property
+    def endpoint_id(self) -> Optional[int]:
+        return self._endpoint_id
+
+    @endpoint_id.setter
+    def endpoint_id(self, endpoint_id: Optional[int]) -> None:
+        # The TUI picks the endpoint after connecting, so the Docker proxy URL
+        # is rebuilt whenever it changes rather than on every request.
+        self._endpoint_id = endpoint_id
+        self._containers_url = f"{self.base_url}/api/endpoints/{endpoint_id}/docker/containers"
+
     def _login(self, username: str, password: str) -> str:
         response = self.session.post(
             f"{self.base_url}/api/auth",
@@ -65,23 +160,17 @@ class PortainerClient:
             
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except self._requests.exceptions.RequestException as e:
              raise RuntimeError(f"Failed to retrieve endpoints: {e}")
 
     def resolve_container_id(self, container_ref: str) -> str:
         """Allow users to reference a container by prefix or name."""
-        response = self.session.get(
-            f"{self.base_url}/api/endpoints/{self.endpoint_id}/docker/containers/json",
-            params={"all": True},
-            timeout=15,
-        )
-        response.raise_for_status()
-
+        # Names are only compared when the ID prefix doesn't already match.
         matches: List[str] = []
-        for container in response.json():
-            container_id = container["Id"]
-            names = [name.lstrip("/") for name in container.get("Names", [])]
-            if container_id.startswith(container_ref) or container_ref in names:
+        for container_id, names in self._iter_container_names():
+            if container_id.startswith(container_ref) or any(
+                (name[1:] if name.startswith("/") else name) == container_ref for name in names
+            ):
                 matches.append(container_id)
 
         if not matches:
@@ -91,30 +180,115 @@ class PortainerClient:
 
         return matches[0]
 
+    def _get_container_list(self) -> Any:
+        """Request the endpoint's container listing, streamed if ijson can parse it."""
+        response = self.session.get(
+            f"{self._containers_url}/json",
+            params={"all": True},
+            stream=self._ijson is not None,
+            timeout=15,
+        )
+        response.raise_for_status()
+        if self._ijson is not None:
+            response.raw.decode_content = True
+        return response
+
+    def iter_containers(self) -> Iterator[Dict[str, Any]]:
+        """Yield container summaries, one at a time when ijson is available."""
+        response = self._get_container_list()
+        if self._ijson is None:
+            yield from self._json_loads(response.content)
+            return
+
+        try:
+            yield from self._ijson.items(response.raw, "item")
+        finally:
+            response.close()
+
+    def _iter_container_names(self) -> Iterator[Tuple[str, List[str]]]:
+        """Yield ``(Id, Names)`` for every container on the endpoint.
+
+        With ijson available the listing is streamed and only those two fields
+        are materialised; labels, mounts and network settings are skipped.
+        """
+        response = self._get_container_list()
+        if self._ijson is None:
+            for container in self._json_loads(response.content):
+                yield container["Id"], container.get("Names") or []
+            return
+
+        try:
+            container_id = ""
+            names: List[str] = []
+            for prefix, event, value in self._ijson.parse(response.raw):
+                if prefix == "item.Id":
+                    container_id = value
+                elif prefix == "item.Names.item":
+                    names.append(value)
+                elif prefix == "item" and event == "end_map":
+                    yield container_id, names
+                    container_id, names = "", []
+        finally:
+            response.close()
+
     def get_container_details(self, container_id: str) -> Dict[str, Any]:
         response = self.session.get(
-            f"{self.base_url}/api/endpoints/{self.endpoint_id}/docker/containers/{container_id}/json",
+            f"{self._containers_url}/{container_id}/json",
             timeout=15,
         )
         response.raise_for_status()
-        return response.json()
+        return self._json_loads(response.content)
+
+    def find_container(self, container_ref: str) -> Dict[str, Any]:
+        """Resolve a container reference and return its details.
+
+        When the reference looks like a Docker name, the inspect call is issued
+        alongside the container listing so both round trips overlap. The
+        listing is still used to reject ambiguous references.
+        """
+        if not _CONTAINER_NAME_RE.fullmatch(container_ref):
+            return self.get_container_details(self.resolve_container_id(container_ref))
+
+        # Deferred so that --help and TUI startup don't pay for importing it.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            inspect_future = executor.submit(
+                self.session.get,
+                f"{self._containers_url}/{container_ref}/json",
+                timeout=15,
+            )
+            container_id = self.resolve_container_id(container_ref)
+            try:
+                response = inspect_future.result()
+            except self._requests.exceptions.RequestException:
+                response = None
+
+        if response is not None and response.status_code == 200:
+            details = self._json_loads(response.content)
+            if details.get("Id") == container_id:
+                return details
 
+        return self.get_container_details(container_id)
 
+
+@functools.lru_cache(maxsize=256)
 def sanitize_name(name: str) -> str:
     """Convert Docker names to valid Kubernetes resource names."""
-    name = re.sub(r"[^a-z0-9-]+", "-", name.lower()).strip("-")
+    name = name.lower()
+    if name.isascii():
+        name = name.translate(_SANITIZE_TABLE)
+    else:
+        name = _SANITIZE_RE.sub("-", name)
+    while "--" in name:
+        name = name.replace("--", "-")
+    name = name.strip("-")
     return name or "container"
 
 
 def transform_env(env_list: Iterable[str]) -> List[Dict[str, str]]:
-    env_entries: List[Dict[str, str]] = []
-    for item in env_list:
-        if "=" in item:
-            key, value = item.split("=", 1)
-        else:
-            key, value = item, ""
-        env_entries.append({"name": key, "value": value})
-    return env_entries
+    # partition() leaves value empty for bare "KEY" entries.
+    return [{"name": key, "value": value} for key, _, value in (item.partition("=") for item in env_list)]
 
 
 def build_volumes(mounts: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -178,33 +352,57 @@ def collect_ports(port_map: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return ports
 
 
+def _walk_container(
+    container_details: Dict[str, Any],
+    config: Dict[str, Any],
+) -> Tuple[List[Dict[str, str]], Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """Extract env vars, volumes and ports from container JSON in one place.
+
+    Docker reports missing sections as ``null``, so each is normalised to an
+    empty collection before it is walked. ``config`` is the already
+    normalised ``Config`` section.
+    """
+    network = container_details.get("NetworkSettings") or {}
+    env_vars = transform_env(config.get("Env") or ())
+    mounts = build_volumes(container_details.get("Mounts") or ())
+    ports = collect_ports(network.get("Ports"))
+    return env_vars, mounts, ports
+
+
 def build_k8s_documents(
     container_details: Dict[str, Any],
     namespace: str,
 ) -> List[Dict[str, Any]]:
-    config = container_details.get("Config", {})
+    config = container_details.get("Config") or {}
     container_name = sanitize_name(config.get("Hostname") or container_details.get("Name", "app"))
     image = config.get("Image", "image:latest")
-    env_vars = transform_env(config.get("Env", []))
-    mounts = build_volumes(container_details.get("Mounts", []))
-    ports = collect_ports(container_details.get("NetworkSettings", {}).get("Ports"))
+    env_vars, mounts, ports = _walk_container(container_details, config)
+    # One labels dict is shared by the selector, pod template and Service.
+    labels = {"app": container_name}
 
+    # Build each spec with every key up front and drop the unused ones, rather
+    # than growing the dicts one conditional assignment at a time.
     container_spec: Dict[str, Any] = {
         "name": container_name,
         "image": image,
-    }
-    if config.get("Cmd"):
-        container_spec["args"] = config["Cmd"]
-    if config.get("Entrypoint"):
-        container_spec["command"] = config["Entrypoint"]
-    if env_vars:
-        container_spec["env"] = env_vars
-    if mounts["volume_mounts"]:
-        container_spec["volumeMounts"] = mounts["volume_mounts"]
-    if ports:
-        container_spec["ports"] = [
+        "args": config.get("Cmd") or None,
+        "command": config.get("Entrypoint") or None,
+        "env": env_vars or None,
+        "volumeMounts": mounts["volume_mounts"] or None,
+        "ports": [
             {"containerPort": port["targetPort"], "protocol": port["protocol"]} for port in ports
-        ]
+        ] or None,
+    }
+    for key in ("args", "command", "env", "volumeMounts", "ports"):
+        if container_spec[key] is None:
+            del container_spec[key]
+
+    pod_spec: Dict[str, Any] = {
+        "containers": [container_spec],
+        "volumes": mounts["volumes"] or None,
+    }
+    if pod_spec["volumes"] is None:
+        del pod_spec["volumes"]
 
     deployment: Dict[str, Any] = {
         "apiVersion": "apps/v1",
@@ -212,15 +410,13 @@ def build_k8s_documents(
         "metadata": {"name": container_name, "namespace": namespace},
         "spec": {
             "replicas": 1,
-            "selector": {"matchLabels": {"app": container_name}},
+            "selector": {"matchLabels": labels},
             "template": {
-                "metadata": {"labels": {"app": container_name}},
-                "spec": {"containers": [container_spec]},
+                "metadata": {"labels": labels},
+                "spec": pod_spec,
             },
         },
     }
-    if mounts["volumes"]:
-        deployment["spec"]["template"]["spec"]["volumes"] = mounts["volumes"]
 
     documents: List[Dict[str, Any]] = [deployment]
 
@@ -230,7 +426,7 @@ def build_k8s_documents(
             "kind": "Service",
             "metadata": {"name": f"{container_name}-svc", "namespace": namespace},
             "spec": {
-                "selector": {"app": container_name},
+                "selector": labels,
                 "ports": ports,
                 "type": "ClusterIP",
             },
@@ -242,32 +438,55 @@ def build_k8s_documents(
 
 def dump_yaml(documents: Iterable[Dict[str, Any]]) -> str:
     if yaml:
-        return "\n---\n".join(yaml.safe_dump(doc, sort_keys=False).rstrip() for doc in documents)
+        return "\n---\n".join(yaml.dump(doc, Dumper=_Dumper, sort_keys=False, default_flow_style=False).rstrip() for doc in documents)
 
     return "\n---\n".join(_fallback_yaml_dump(doc).rstrip() for doc in documents)
 
 
+def stream_yaml(documents: Iterable[Dict[str, Any]], stream: TextIO) -> None:
+    """Write documents to ``stream`` without building the whole manifest first."""
+    if yaml:
+        yaml.dump_all(documents, stream, Dumper=_Dumper, sort_keys=False, default_flow_style=False)
+        return
+
+    stream.write(dump_yaml(documents))
+    stream.write("\n")
+
+
 def _fallback_yaml_dump(node: Any, indent: int = 0) -> str:
-    spacing = " " * indent
-    if isinstance(node, dict):
-        lines: List[str] = []
-        for key, value in node.items():
-            if isinstance(value, (dict, list)):
-                lines.append(f"{spacing}{key}:")
-                lines.append(_fallback_yaml_dump(value, indent + 2))
-            else:
-                lines.append(f"{spacing}{key}: {value}")
-        return "\n".join(lines)
-    if isinstance(node, list):
-        lines = []
-        for item in node:
-            if isinstance(item, (dict, list)):
-                lines.append(f"{spacing}-")
-                lines.append(_fallback_yaml_dump(item, indent + 2))
-            else:
-                lines.append(f"{spacing}- {item}")
-        return "\n".join(lines)
-    return f"{spacing}{node}"
+    buf = io.StringIO()
+    # Entries are (node, indent, line): a pre-rendered line is written as-is,
+    # otherwise the node is expanded and its children pushed in reverse order.
+    stack: List[Tuple[Any, int, Optional[str]]] = [(node, indent, None)]
+    first = True
+    while stack:
+        node, indent, line = stack.pop()
+        if line is None:
+            spacing = " " * indent
+            if isinstance(node, dict) and node:
+                for key, value in reversed(node.items()):
+                    if isinstance(value, (dict, list)):
+                        stack.append((value, indent + 2, None))
+                        stack.append((None, 0, f"{spacing}{key}:"))
+                    else:
+                        stack.append((None, 0, f"{spacing}{key}: {value}"))
+                continue
+            if isinstance(node, list) and node:
+                for item in reversed(node):
+                    if isinstance(item, (dict, list)):
+                        stack.append((item, indent + 2, None))
+                        stack.append((None, 0, f"{spacing}-"))
+                    else:
+                        stack.append((None, 0, f"{spacing}- {item}"))
+                continue
+            # Empty containers render as an empty line, scalars as themselves.
+            line = "" if isinstance(node, (dict, list)) else f"{spacing}{node}"
+
+        if not first:
+            buf.write("\n")
+        buf.write(line)
+        first = False
+    return buf.getvalue()
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -318,14 +537,15 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     # TUI mode
     tui_parser = subparsers.add_parser("tui", help="Terminal user interface mode (interactive)")
     
-    # Default to CLI if no subcommand
-    args = parser.parse_args(argv)
-    if args.mode is None:
-        args.mode = "cli"
-        # Re-parse with CLI mode expectations for backward compatibility
-        args = cli_parser.parse_args(argv)
-    
-    return args
+    cli_parser.set_defaults(mode="cli")
+
+    # Default to CLI if no subcommand, so argv is parsed exactly once
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or argv[0] not in ("cli", "tui", "-h", "--help"):
+        argv = ["cli", *argv]
+
+    return parser.parse_args(argv)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -354,11 +574,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         password=args.password,
     )
 
-    container_id = client.resolve_container_id(args.container)
-    container_details = client.get_container_details(container_id)
+    container_details = client.find_container(args.container)
     documents = build_k8s_documents(container_details, args.namespace)
-    manifest = dump_yaml(documents)
-    print(manifest)
+    stream_yaml(documents, sys.stdout)
     return 0
 
 
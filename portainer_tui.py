@@ -3,14 +3,17 @@
 
 from __future__ import annotations
 
-import subprocess
-from typing import Any, Dict, Optional
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, List, Optional
 
-from textual import on
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, ScrollableContainer, Vertical
 from textual.reactive import var
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Checkbox,
@@ -23,6 +26,7 @@ from textual.widgets import (
     TextArea,
 )
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 
 from config import config_exists, load_config, save_config
 from portainer_to_k8s import (
@@ -32,6 +36,15 @@ from portainer_to_k8s import (
     sanitize_name,
 )
 
+# Number of prefetched container details kept in memory
+DETAILS_CACHE_SIZE = 16
+# Seconds the highlight must rest on a container before its details are prefetched
+PREFETCH_DELAY = 0.3
+# Seconds an export waits for a prefetch of the same container to finish
+PREFETCH_WAIT = 15
+# Containers added to the list per UI update while the listing streams in
+CONTAINER_BATCH_SIZE = 64
+
 
 
 class EndpointSelectScreen(Screen):
@@ -89,11 +102,12 @@ class EndpointSelectScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        option_list = self.query_one("#endpoints", OptionList)
+        options = []
         for endpoint in self.endpoints:
             name = endpoint.get("Name", "Unnamed")
             e_id = str(endpoint.get("Id", "?"))
-            option_list.add_option(Option(f"{name} (ID: {e_id})", id=e_id))
+            options.append(Option(f"{name} (ID: {e_id})", id=e_id))
+        self.query_one("#endpoints", OptionList).add_options(options)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-quit":
@@ -265,23 +279,39 @@ class ConfigWizardScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize the wizard."""
+        # Cache widgets toggled on every highlight change
+        self._auth_list = self.query_one("#auth-method", OptionList)
+        self._username_group = self.query_one("#username-group")
+        self._password_group = self.query_one("#password-group")
+        self._last_auth_idx: Optional[int] = -1
+        # Latest stripped value of each input, kept current by on_input_changed
+        self._field_values: Dict[str, str] = {
+            "portainer-url": "",
+            "api-key": "",
+            "username": "",
+            "password": "",
+        }
+
         # Default to API Key method
         self._update_auth_fields()
 
+    @on(Input.Changed)
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Track input values so connecting doesn't have to query the DOM."""
+        if event.input.id in self._field_values:
+            self._field_values[event.input.id] = event.value.strip()
+
     def _update_auth_fields(self) -> None:
         """Show/hide auth fields based on selection."""
-        auth_method_list = self.query_one("#auth-method", OptionList)
-        selected_index = auth_method_list.highlighted
-
-        username_group = self.query_one("#username-group")
-        password_group = self.query_one("#password-group")
+        selected_index = self._auth_list.highlighted
+        if selected_index == self._last_auth_idx:
+            return
+        self._last_auth_idx = selected_index
 
-        if selected_index == 0:  # API Key
-            username_group.display = False
-            password_group.display = False
-        else:  # Username/Password
-            username_group.display = True
-            password_group.display = True
+        # API Key hides the fields, Username/Password shows them
+        show_credentials = selected_index != 0
+        self._username_group.display = show_credentials
+        self._password_group.display = show_credentials
 
     @on(OptionList.OptionHighlighted)
     def on_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
@@ -298,9 +328,9 @@ class ConfigWizardScreen(Screen):
 
     def _save_and_connect(self) -> None:
         """Save configuration and attempt connection."""
-        url = self.query_one("#portainer-url", Input).value.strip()
-        auth_method_list = self.query_one("#auth-method", OptionList)
-        auth_method = auth_method_list.highlighted
+        values = self._field_values
+        url = values["portainer-url"]
+        auth_method = self._auth_list.highlighted
 
         # Validation
         if not url:
@@ -308,15 +338,15 @@ class ConfigWizardScreen(Screen):
             return
 
         if auth_method == 0:  # API Key
-            api_key = self.query_one("#api-key", Input).value.strip()
+            api_key = values["api-key"]
             if not api_key:
                 self.app.notify("Please enter an API key", severity="error")
                 return
             username = None
             password = None
         else:  # Username/Password
-            username = self.query_one("#username", Input).value.strip()
-            password = self.query_one("#password", Input).value.strip()
+            username = values["username"]
+            password = values["password"]
             if not username or not password:
                 self.app.notify("Please enter username and password", severity="error")
                 return
@@ -460,7 +490,11 @@ class WelcomeScreen(Screen):
 
     def on_mount(self) -> None:
         """Load configuration and pre-fill form."""
-        config = load_config()
+        self._password = ""
+        self._apply_config(load_config())
+
+    def _apply_config(self, config: Optional[Dict[str, Any]]) -> None:
+        """Store the config and show the password field if it needs one."""
         if config and "portainer" in config:
             portainer_config = config["portainer"]
             auth_config = portainer_config.get("auth", {})
@@ -484,6 +518,11 @@ class WelcomeScreen(Screen):
         elif event.button.id == "btn-connect":
             self._attempt_connection()
 
+    @on(Input.Changed, "#password")
+    def on_password_changed(self, event: Input.Changed) -> None:
+        """Track the password so connecting doesn't have to query the DOM."""
+        self._password = event.value.strip()
+
     def _reconfigure(self) -> None:
         """Go back to configuration wizard."""
         self.app.pop_screen()
@@ -491,6 +530,10 @@ class WelcomeScreen(Screen):
 
     def _attempt_connection(self) -> None:
         """Attempt to connect using saved configuration."""
+        # load_config() is memoized on the file's mtime, so re-reading is cheap
+        # and picks up any edits made since the screen was mounted. The form is
+        # refreshed too, so a newly required password field is shown.
+        self._apply_config(load_config())
         config = self.app.config
         if not config or "portainer" not in config:
             self.app.notify("Configuration error", severity="error")
@@ -512,7 +555,7 @@ class WelcomeScreen(Screen):
         password = None
 
         if username:
-            password = self.query_one("#password", Input).value.strip()
+            password = self._password
             if not password:
                 self.app.notify("Please enter your password", severity="error")
                 return
@@ -589,6 +632,10 @@ class ContainerSelectScreen(Screen):
 
     containers_loaded = var(False)
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._prefetch_timer: Optional[Timer] = None
+
     def compose(self) -> ComposeResult:
         """Compose the container select screen."""
         yield Header(show_clock=False)
@@ -604,7 +651,7 @@ class ContainerSelectScreen(Screen):
                 yield OptionList(id="containers")
 
             with Horizontal(id="button-container"):
-                yield Button("Export", id="btn-export", variant="primary")
+                yield Button("Export", id="btn-export", variant="primary", disabled=True)
                 yield Button("Back", id="btn-back")
                 yield Button("Quit", id="btn-quit", variant="error")
 
@@ -612,38 +659,58 @@ class ContainerSelectScreen(Screen):
 
     def on_mount(self) -> None:
         """Load containers when screen is mounted."""
-        self.load_containers()
-
-    def load_containers(self) -> None:
-        """Load containers from Portainer."""
+        # Details prefetched on an earlier visit may be stale by now
+        self.app.details_cache.clear()
+        self._load_containers_worker()
+
+    @work(exclusive=True, thread=True)
+    def _load_containers_worker(self) -> None:
+        """Stream containers from Portainer without blocking the UI.
+
+        Options are handed to the UI thread in batches so the list starts
+        filling in before the whole response has arrived.
+        """
+        options: List[Option] = []
+        loaded = 0
         try:
             client: PortainerClient = self.app.client
-            response = client.session.get(
-                f"{client.base_url}/api/endpoints/{client.endpoint_id}/docker/containers/json",
-                params={"all": True},
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            containers = response.json()
-            if not containers:
-                self.app.notify("No containers found", severity="warning")
-                return
-
-            option_list = self.query_one("#containers", OptionList)
-            for container in containers:
-                container_id = container["Id"][:12]  # Short ID
+            for container in client.iter_containers():
+                container_id = container["Id"]
                 names = container.get("Names", [])
                 name = names[0].lstrip("/") if names else "unnamed"
                 status = container.get("State", "unknown")
-                display = f"{name} ({container_id}) - {status}"
-                option_list.add_option(Option(display, id=container["Id"]))
-
-            self.query_one("#status-message", Static).update("✓ Containers loaded")
-            self.containers_loaded = True
+                display = f"{name} ({container_id[:12]}) - {status or 'unknown'}"
+                options.append(Option(display, id=container_id))
 
+                if len(options) >= CONTAINER_BATCH_SIZE:
+                    self.app.call_from_thread(self._add_options, options)
+                    loaded += len(options)
+                    options = []
         except Exception as e:
-            self.app.notify(f"Failed to load containers: {str(e)}", severity="error")
+            self.app.call_from_thread(
+                self.app.notify, f"Failed to load containers: {str(e)}", severity="error"
+            )
+            return
+
+        self.app.call_from_thread(self._finish_loading, options, loaded + len(options))
+
+    def _add_options(self, options: List[Option]) -> None:
+        """Append a batch of options in one insert; runs on the UI thread."""
+        self.query_one("#containers", OptionList).add_options(options)
+
+    def _finish_loading(self, options: List[Option], total: int) -> None:
+        """Add the final batch and report the result; runs on the UI thread."""
+        if not total:
+            self.app.notify("No containers found", severity="warning")
+            return
+
+        self._add_options(options)
+        self.query_one("#status-message", Static).update("✓ Containers loaded")
+        self.containers_loaded = True
+
+    def watch_containers_loaded(self, loaded: bool) -> None:
+        """Only allow exporting once there are containers to pick from."""
+        self.query_one("#btn-export", Button).disabled = not loaded
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -654,6 +721,41 @@ class ContainerSelectScreen(Screen):
         elif event.button.id == "btn-export":
             self._export_container()
 
+    @on(OptionList.OptionHighlighted, "#containers")
+    def on_container_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        """Prefetch details once the highlight settles on a container."""
+        # Restart the delay on every move so scrolling through the list only
+        # fetches the container the user stops on.
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+
+        container_id = event.option.id
+        if container_id:
+            self._prefetch_timer = self.set_timer(
+                PREFETCH_DELAY, partial(self._start_prefetch, container_id)
+            )
+
+    def _start_prefetch(self, container_id: str) -> None:
+        """Fetch details unless they are cached or already being fetched."""
+        self._prefetch_timer = None
+        if container_id in self.app.details_cache or container_id in self.app.details_pending:
+            return
+        self.app.details_pending[container_id] = threading.Event()
+        self._prefetch_details(container_id)
+
+    @work(thread=True, group="prefetch")
+    def _prefetch_details(self, container_id: str) -> None:
+        """Fetch container details in the background and cache them."""
+        details: Optional[Dict[str, Any]] = None
+        try:
+            details = self.app.client.get_container_details(container_id)
+        except Exception:
+            # Not fatal: the details are fetched again on export
+            pass
+        finally:
+            self.app.call_from_thread(self.app.finish_prefetch, container_id, details)
+
     def _export_container(self) -> None:
         """Export the selected container."""
         option_list = self.query_one("#containers", OptionList)
@@ -664,6 +766,10 @@ class ContainerSelectScreen(Screen):
         # Get the selected option
         selected_option = option_list.get_option_at_index(option_list.highlighted)
         if selected_option and selected_option.id:
+            # The export fetches the details itself if no prefetch has started
+            if self._prefetch_timer is not None:
+                self._prefetch_timer.stop()
+                self._prefetch_timer = None
             container_id = selected_option.id
             self.app.selected_container_id = container_id
             self.app.push_screen(ConfigureScreen())
@@ -748,28 +854,60 @@ class ConfigureScreen(Screen):
 
     def _generate_manifest(self) -> None:
         """Generate the Kubernetes manifest."""
+        namespace = self.query_one("#namespace", Input).value.strip()
+        if not namespace:
+            namespace = "default"
+
+        # Re-enabled once the worker reports back, so a second press can't
+        # start another generation while this one is running.
+        self.query_one("#btn-preview", Button).disabled = True
+        self._generate_worker(namespace, self.app.selected_container_id)
+
+    @work(exclusive=True, thread=True)
+    def _generate_worker(self, namespace: str, container_id: str) -> None:
+        """Fetch details and render the manifest off the UI thread."""
         try:
-            namespace = self.query_one("#namespace", Input).value.strip()
-            if not namespace:
-                namespace = "default"
-
             client: PortainerClient = self.app.client
-            container_id = self.app.selected_container_id
 
-            # Fetch container details
-            container_details = client.get_container_details(container_id)
+            # Use prefetched details if the container was highlighted long enough,
+            # waiting for a prefetch that is still running rather than repeating it
+            pending = self.app.details_pending.get(container_id)
+            if pending is not None:
+                pending.wait(PREFETCH_WAIT)
+            container_details = self.app.details_cache.get(container_id)
+            if container_details is None:
+                container_details = client.get_container_details(container_id)
+                self.app.call_from_thread(
+                    self.app.cache_container_details, container_id, container_details
+                )
 
             # Generate K8s documents
             documents = build_k8s_documents(container_details, namespace)
             manifest = dump_yaml(documents)
+        except Exception as e:
+            if not get_current_worker().is_cancelled:
+                self.app.call_from_thread(self._on_manifest_failed, str(e))
+            return
 
-            # Move to preview screen
-            self.app.manifest = manifest
-            self.app.container_details = container_details
-            self.app.push_screen(PreviewScreen())
+        # Cancelled when the user has left this screen or started over
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._on_manifest_ready, manifest, container_details)
 
-        except Exception as e:
-            self.app.notify(f"Failed to generate manifest: {str(e)}", severity="error")
+    def _on_manifest_ready(self, manifest: str, container_details: Dict[str, Any]) -> None:
+        """Move to the preview screen; runs on the UI thread."""
+        if self.app.screen is not self:
+            return
+        self.query_one("#btn-preview", Button).disabled = False
+        self.app.manifest = manifest
+        self.app.container_details = container_details
+        self.app.push_screen(PreviewScreen())
+
+    def _on_manifest_failed(self, error: str) -> None:
+        """Report a failed generation; runs on the UI thread."""
+        if self.app.screen is not self:
+            return
+        self.query_one("#btn-preview", Button).disabled = False
+        self.app.notify(f"Failed to generate manifest: {error}", severity="error")
 
 
 class PreviewScreen(Screen):
@@ -808,6 +946,10 @@ class PreviewScreen(Screen):
     }
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._filename: Optional[str] = None
+
     def compose(self) -> ComposeResult:
         """Compose the preview screen."""
         yield Header(show_clock=False)
@@ -840,19 +982,26 @@ class PreviewScreen(Screen):
         elif event.button.id == "btn-copy":
             self._copy_to_clipboard()
 
-    def _save_manifest(self) -> None:
-        """Save the manifest to a file."""
-        try:
-            # Generate filename from container name
+    def _manifest_filename(self) -> str:
+        """Generate filename from container name, once per previewed manifest."""
+        if self._filename is None:
             container_details = self.app.container_details
-            config = container_details.get("Config", {})
+            config = container_details.get("Config") or {}
             container_name = sanitize_name(
                 config.get("Hostname") or container_details.get("Name", "app")
             )
-            filename = f"{container_name}-manifest.yaml"
+            self._filename = f"{container_name}-manifest.yaml"
+        return self._filename
+
+    def _save_manifest(self) -> None:
+        """Save the manifest to a file."""
+        try:
+            filename = self._manifest_filename()
 
-            with open(filename, "w") as f:
-                f.write(self.app.manifest)
+            # Encode once and write the bytes in a single call
+            data = self.app.manifest.encode("utf-8")
+            with open(filename, "wb") as f:
+                f.write(data)
 
             self.app.notify(f"Manifest saved to {filename}", severity="information")
         except Exception as e:
@@ -861,15 +1010,9 @@ class PreviewScreen(Screen):
     def _copy_to_clipboard(self) -> None:
         """Copy manifest to clipboard."""
         try:
-            process = subprocess.Popen(
-                ["xclip", "-selection", "clipboard"],
-                stdin=subprocess.PIPE,
-            )
-            process.communicate(self.app.manifest.encode())
-            if process.returncode == 0:
-                self.app.notify("Manifest copied to clipboard", severity="information")
-            else:
-                self.app.notify("xclip not found - clipboard copy failed", severity="warning")
+            # OSC 52 escape written to the terminal; no helper process needed
+            self.app.copy_to_clipboard(self.app.manifest)
+            self.app.notify("Manifest copied to clipboard", severity="information")
         except Exception as e:
             self.app.notify(f"Failed to copy to clipboard: {str(e)}", severity="warning")
 
@@ -906,19 +1049,20 @@ class PortainerToK8sApp(App):
     }
     """
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.client: Optional[PortainerClient] = None
+        self.selected_container_id: Optional[str] = None
+        self.manifest: str = ""
+        self.container_details: Dict[str, Any] = {}
+        self.config: Optional[Dict[str, Any]] = None
+        self.pending_config: Optional[Dict[str, Any]] = None
+        self.details_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # Containers whose details are being prefetched; set once the fetch ends
+        self.details_pending: Dict[str, threading.Event] = {}
+
     def on_mount(self) -> None:
         """Start with appropriate screen based on config file existence."""
-        if not hasattr(self, "client"):
-            self.client: Optional[PortainerClient] = None
-        if not hasattr(self, "selected_container_id"):
-            self.selected_container_id: Optional[str] = None
-        if not hasattr(self, "manifest"):
-            self.manifest: str = ""
-        if not hasattr(self, "container_details"):
-            self.container_details: Dict[str, Any] = {}
-        if not hasattr(self, "config"):
-            self.config: Optional[Dict[str, Any]] = None
-        
         # Check if configuration exists
         if config_exists():
             # Load existing config and show welcome screen
@@ -927,6 +1071,21 @@ class PortainerToK8sApp(App):
             # No config - run configuration wizard
             self.push_screen(ConfigWizardScreen())
 
+    def cache_container_details(self, container_id: str, details: Dict[str, Any]) -> None:
+        """Remember container details, keeping only the most recent few."""
+        self.details_cache[container_id] = details
+        self.details_cache.move_to_end(container_id)
+        while len(self.details_cache) > DETAILS_CACHE_SIZE:
+            self.details_cache.popitem(last=False)
+
+    def finish_prefetch(self, container_id: str, details: Optional[Dict[str, Any]]) -> None:
+        """Cache prefetched details, if any, and release anyone waiting on them."""
+        if details is not None:
+            self.cache_container_details(container_id, details)
+        pending = self.details_pending.pop(container_id, None)
+        if pending is not None:
+            pending.set()
+
 
 def run_tui() -> None:
     """Run the TUI application."""
@@ -0,0 +1,29 @@
+import unittest
+from unittest.mock import patch
+
+import config
+from portainer_to_k8s import parse_args
+
+CLI_ARGS = ["--url", "http://portainer.local", "--endpoint", "1", "--api-key", "test", "--container", "web"]
+
+
+@patch.object(config, "load_config", return_value=None)
+class TestParseArgs(unittest.TestCase):
+
+    def test_defaults_to_cli_mode(self, _mock_load_config):
+        """Test that arguments without a subcommand are parsed as CLI mode."""
+        args = parse_args(CLI_ARGS)
+        self.assertEqual(args.mode, "cli")
+        self.assertEqual(args.endpoint, 1)
+        self.assertEqual(args.container, "web")
+
+    def test_explicit_cli_mode(self, _mock_load_config):
+        """Test that the explicit cli subcommand matches the implicit form."""
+        self.assertEqual(parse_args(["cli", *CLI_ARGS]), parse_args(CLI_ARGS))
+
+    def test_tui_mode(self, _mock_load_config):
+        """Test selecting TUI mode."""
+        self.assertEqual(parse_args(["tui"]).mode, "tui")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import config
+
+
+class TestConfigCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(self._tmpdir.name, "config.yaml")
+        self._patcher = patch.object(config, "CONFIG_FILE", path)
+        self._patcher.start()
+        config._CONFIG_CACHE.clear()
+
+    def tearDown(self):
+        self._patcher.stop()
+        config._CONFIG_CACHE.clear()
+        self._tmpdir.cleanup()
+
+    def test_load_config_is_cached(self):
+        """Repeated loads of an unchanged file return the cached result."""
+        config.save_config("http://portainer.local", 1, api_key="test")
+
+        first = config.load_config()
+        with patch.object(config.yaml, "load") as mock_load:
+            second = config.load_config()
+
+        mock_load.assert_not_called()
+        self.assertIs(first, second)
+        self.assertEqual(second["portainer"]["endpoint_id"], 1)
+
+    def test_save_config_invalidates_cache(self):
+        """Saving a new config is picked up by the next load."""
+        config.save_config("http://portainer.local", 1, api_key="test")
+        self.assertEqual(config.load_config()["portainer"]["endpoint_id"], 1)
+
+        config.save_config("http://portainer.local", 2, username="admin")
+        loaded = config.load_config()
+
+        self.assertEqual(loaded["portainer"]["endpoint_id"], 2)
+        self.assertEqual(loaded["portainer"]["auth"]["method"], "username_password")
+
+    def test_delete_config_invalidates_cache(self):
+        """Deleting the config file makes load_config return None."""
+        config.save_config("http://portainer.local", 1, api_key="test")
+        self.assertIsNotNone(config.load_config())
+
+        config.delete_config()
+
+        self.assertIsNone(config.load_config())
+
+
+if __name__ == '__main__':
+    unittest.main()
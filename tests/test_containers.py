@@ -0,0 +1,107 @@
+import io
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+import portainer_to_k8s as _p2k
+from portainer_to_k8s import PortainerClient
+
+CONTAINERS = [
+    {"Id": "abc123def456", "Names": ["/web"]},
+    {"Id": "abd789000000", "Names": ["/db"]},
+    {"Id": "fff000111222", "Names": ["/abc"]},
+]
+
+
+def _response(payload):
+    body = json.dumps(payload).encode()
+    return MagicMock(status_code=200, content=body, raw=io.BytesIO(body))
+
+
+class TestPortainerClientContainers(unittest.TestCase):
+
+    def _client(self, mock_session_cls):
+        mock_session_cls.return_value.get.side_effect = lambda url, **kwargs: _response(CONTAINERS)
+        return PortainerClient("http://portainer.local", endpoint_id=1, api_key="test")
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_resolve_by_name(self, mock_session_cls):
+        """Test resolving a container by its name."""
+        client = self._client(mock_session_cls)
+        self.assertEqual(client.resolve_container_id("db"), "abd789000000")
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_resolve_by_id_prefix(self, mock_session_cls):
+        """Test resolving a container by a unique ID prefix."""
+        client = self._client(mock_session_cls)
+        self.assertEqual(client.resolve_container_id("abc1"), "abc123def456")
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_resolve_ambiguous(self, mock_session_cls):
+        """Test that a ref matching several containers is rejected."""
+        client = self._client(mock_session_cls)
+        with self.assertRaisesRegex(RuntimeError, "Multiple containers"):
+            client.resolve_container_id("ab")
+        # Matches one container by ID prefix and another by name
+        with self.assertRaisesRegex(RuntimeError, "Multiple containers"):
+            client.resolve_container_id("abc")
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_resolve_missing(self, mock_session_cls):
+        """Test that an unknown ref raises."""
+        client = self._client(mock_session_cls)
+        with self.assertRaisesRegex(RuntimeError, "No container matching"):
+            client.resolve_container_id("nope")
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_iter_containers(self, mock_session_cls):
+        """Test that container summaries are yielded in listing order."""
+        client = self._client(mock_session_cls)
+        self.assertEqual(list(client.iter_containers()), CONTAINERS)
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_find_container_by_name(self, mock_session_cls):
+        """Test that a name ref reuses the speculative inspect response."""
+        list_response = _response(CONTAINERS)
+        inspect_response = _response({"Id": "abd789000000"})
+
+        def fake_get(url, **kwargs):
+            return list_response if url.endswith("/containers/json") else inspect_response
+
+        mock_session_cls.return_value.get.side_effect = fake_get
+        client = PortainerClient("http://portainer.local", endpoint_id=1, api_key="test")
+
+        details = client.find_container("db")
+
+        self.assertEqual(details["Id"], "abd789000000")
+        self.assertEqual(mock_session_cls.return_value.get.call_count, 2)
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_find_container_ambiguous(self, mock_session_cls):
+        """Test that the speculative inspect does not bypass ambiguity checks."""
+        list_response = _response(CONTAINERS)
+        inspect_response = _response({"Id": "fff000111222"})
+
+        def fake_get(url, **kwargs):
+            return list_response if url.endswith("/containers/json") else inspect_response
+
+        mock_session_cls.return_value.get.side_effect = fake_get
+        client = PortainerClient("http://portainer.local", endpoint_id=1, api_key="test")
+
+        with self.assertRaisesRegex(RuntimeError, "Multiple containers"):
+            client.find_container("abc")
+
+    @patch.object(_p2k.requests, 'Session')
+    def test_endpoint_change_updates_urls(self, mock_session_cls):
+        """Test that selecting an endpoint after connecting is reflected in requests."""
+        mock_session_cls.return_value.get.return_value = _response({"Id": "abc123def456"})
+        client = PortainerClient("http://portainer.local", api_key="test")
+        client.endpoint_id = 7
+
+        client.get_container_details("abc123def456")
+
+        mock_session_cls.return_value.get.assert_called_once_with(
+            "http://portainer.local/api/endpoints/7/docker/containers/abc123def456/json", timeout=15
+        )
+
+if __name__ == '__main__':
+    unittest.main()
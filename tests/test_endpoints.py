@@ -1,57 +1,110 @@
-import unittest
-from unittest.mock import MagicMock, patch
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+import portainer_to_k8s as _p2k
 from portainer_to_k8s import PortainerClient
 
-class TestPortainerClientEndpoints(unittest.TestCase):
-
-    @patch('portainer_to_k8s.requests.Session')
-    def test_get_endpoints_legacy(self, mock_session_cls):
-        """Test fetching endpoints with legacy API."""
-        mock_session = mock_session_cls.return_value
-        
-        # Mock response for /api/endpoints
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"Id": 1, "Name": "local"}, {"Id": 2, "Name": "remote"}]
-        mock_session.get.return_value = mock_response
-        
-        client = PortainerClient("http://portainer.local", api_key="test")
-        endpoints = client.get_endpoints()
-        
-        self.assertEqual(len(endpoints), 2)
-        self.assertEqual(endpoints[0]["Name"], "local")
-        mock_session.get.assert_called_with("http://portainer.local/api/endpoints", params={"limit": 100}, timeout=15)
-
-    @patch('portainer_to_k8s.requests.Session')
-    def test_get_endpoints_fallback(self, mock_session_cls):
-        """Test fetching endpoints with fallback to environments API."""
-        mock_session = mock_session_cls.return_value
-        
-        # Mock 404 for /api/endpoints
-        mock_response_404 = MagicMock()
-        mock_response_404.status_code = 404
-        
-        # Mock 200 for /api/environments
-        mock_response_200 = MagicMock()
-        mock_response_200.status_code = 200
-        mock_response_200.json.return_value = [{"Id": 1, "Name": "local-env"}]
-        
-        # Configure side_effect for sequential calls
-        mock_session.get.side_effect = [mock_response_404, mock_response_200]
-        
-        client = PortainerClient("http://portainer.local", api_key="test")
-        endpoints = client.get_endpoints()
-        
-        self.assertEqual(len(endpoints), 1)
-        self.assertEqual(endpoints[0]["Name"], "local-env")
-        
-        # Verify calls
-        from unittest.mock import call
-        expected_calls = [
-            call("http://portainer.local/api/endpoints", params={"limit": 100}, timeout=15),
-            call("http://portainer.local/api/environments", params={"limit": 100}, timeout=15)
-        ]
-        mock_session.get.assert_has_calls(expected_calls)
-
-if __name__ == '__main__':
-    unittest.main()
+BASE_URL = "http://portainer.local"
+ENDPOINTS_URL = f"{BASE_URL}/api/endpoints"
+ENVIRONMENTS_URL = f"{BASE_URL}/api/environments"
+DEFAULT_PARAMS = {"limit": 100}
+DEFAULT_TIMEOUT = 15
+
+
+class _FastResp:
+    """Lightweight stand-in for a requests.Response."""
+
+    __slots__ = ("status_code", "_p")
+
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._p = payload
+
+    def json(self):
+        return self._p
+
+    def raise_for_status(self):
+        pass
+
+
+# Response stubs are never mutated, so one instance is shared by every test.
+_RESP_LEGACY_OK = _FastResp(200, [{"Id": 1, "Name": "local"}, {"Id": 2, "Name": "remote"}])
+_RESP_FALLBACK_404 = _FastResp(404)
+_RESP_FALLBACK_OK = _FastResp(200, [{"Id": 1, "Name": "local-env"}])
+
+# (responses in call order, expected endpoint names, requested URLs)
+CASES = [
+    pytest.param(
+        [_RESP_LEGACY_OK],
+        ["local", "remote"],
+        [ENDPOINTS_URL],
+        id="legacy",
+    ),
+    pytest.param(
+        [_RESP_FALLBACK_404, _RESP_FALLBACK_OK],
+        ["local-env"],
+        [ENDPOINTS_URL, ENVIRONMENTS_URL],
+        id="fallback",
+    ),
+]
+
+
+@pytest.fixture
+def client_and_session(monkeypatch):
+    """A client whose requests.Session is replaced by a fresh MagicMock."""
+    session = MagicMock()
+    monkeypatch.setattr(_p2k.requests, "Session", lambda: session)
+    yield PortainerClient(BASE_URL, api_key="test"), session
+
+
+@pytest.mark.parametrize("responses, expected_names, urls", CASES)
+def test_get_endpoints(client_and_session, responses, expected_names, urls):
+    """Test fetching endpoints with the legacy API and the environments fallback."""
+    client, session = client_and_session
+    session.get.side_effect = responses
+
+    endpoints = client.get_endpoints()
+
+    assert [endpoint["Name"] for endpoint in endpoints] == expected_names
+    assert session.get.call_count == len(urls)
+    assert session.get.call_args_list == [call(url, params=DEFAULT_PARAMS, timeout=DEFAULT_TIMEOUT) for url in urls]
+
+
+def test_session_is_reused():
+    """The client builds one pooled Session and reuses it for every call."""
+    with patch.object(_p2k.requests, "Session") as session_cls:
+        session_cls.return_value.get.return_value = _FastResp(200, [])
+        client = PortainerClient(BASE_URL, api_key="test")
+        for _ in range(5):
+            client.get_endpoints()
+
+    assert session_cls.call_count == 1
+    assert session_cls.return_value.get.call_count == 5
+    mounted = {args[0]: args[1] for args, _ in session_cls.return_value.mount.call_args_list}
+    assert set(mounted) == {"http://", "https://"}
+    assert all(isinstance(adapter, _p2k.requests.adapters.HTTPAdapter) for adapter in mounted.values())
+
+
+def test_get_endpoints_thread_safe(client_and_session):
+    """Parallel get_endpoints calls share one Session without corrupting results."""
+    client, session = client_and_session
+    expected = [{"Id": 1, "Name": "x"}]
+    lock = threading.Lock()
+    calls = [0]
+
+    def fake_get(url, **kwargs):
+        with lock:
+            calls[0] += 1
+        return _FastResp(200, expected)
+
+    # A plain function rather than a MagicMock: mock call bookkeeping is not
+    # thread-safe, so only the lock-guarded counter is trusted.
+    session.get = fake_get
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get_endpoints(), range(32)))
+
+    assert results == [expected] * 32
+    assert calls[0] == 32
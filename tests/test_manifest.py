@@ -0,0 +1,180 @@
+import io
+import textwrap
+import unittest
+
+from portainer_to_k8s import _fallback_yaml_dump, build_k8s_documents, dump_yaml, sanitize_name, stream_yaml
+
+
+CONTAINER_DETAILS = {
+    "Name": "/web",
+    "Config": {
+        "Hostname": "Web_1",
+        "Image": "nginx:1.25",
+        "Env": ["A=1", "B=x=y", "FLAG"],
+        "Cmd": ["nginx", "-g", "daemon off;"],
+        "Entrypoint": None,
+    },
+    "Mounts": [
+        {"Type": "bind", "Source": "/srv/html", "Destination": "/usr/share/nginx/html", "RW": False},
+        {"Type": "volume", "Name": "cache", "Destination": "/cache", "RW": True},
+    ],
+    "NetworkSettings": {
+        "Ports": {
+            "80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}],
+            "443/tcp": None,
+            "bad": None,
+        },
+    },
+}
+
+EXPECTED_MANIFEST = textwrap.dedent("""\
+    apiVersion: apps/v1
+    kind: Deployment
+    metadata:
+      name: web-1
+      namespace: prod
+    spec:
+      replicas: 1
+      selector:
+        matchLabels:
+          app: web-1
+      template:
+        metadata:
+          labels:
+            app: web-1
+        spec:
+          containers:
+          - name: web-1
+            image: nginx:1.25
+            args:
+            - nginx
+            - -g
+            - daemon off;
+            env:
+            - name: A
+              value: '1'
+            - name: B
+              value: x=y
+            - name: FLAG
+              value: ''
+            volumeMounts:
+            - name: srv-html
+              mountPath: /usr/share/nginx/html
+              readOnly: true
+            - name: cache
+              mountPath: /cache
+            ports:
+            - containerPort: 80
+              protocol: TCP
+            - containerPort: 443
+              protocol: TCP
+          volumes:
+          - name: srv-html
+            hostPath:
+              path: /srv/html
+              type: Directory
+          - name: cache
+            persistentVolumeClaim:
+              claimName: cache
+    ---
+    apiVersion: v1
+    kind: Service
+    metadata:
+      name: web-1-svc
+      namespace: prod
+    spec:
+      selector:
+        app: web-1
+      ports:
+      - name: port-80-tcp
+        port: 8080
+        targetPort: 80
+        protocol: TCP
+      - name: port-443-tcp
+        port: 443
+        targetPort: 443
+        protocol: TCP
+      type: ClusterIP""")
+
+
+class TestSanitizeName(unittest.TestCase):
+
+    def test_sanitize_name(self):
+        """Docker names are lowered and invalid characters replaced."""
+        self.assertEqual(sanitize_name("/My_App.Web"), "my-app-web")
+        self.assertEqual(sanitize_name("/var/lib/data"), "var-lib-data")
+        self.assertEqual(sanitize_name("redis-1"), "redis-1")
+
+    def test_sanitize_name_collapses_dashes(self):
+        """Runs of separators collapse to a single dash."""
+        self.assertEqual(sanitize_name("my__app--_web"), "my-app-web")
+        self.assertEqual(sanitize_name("Café Ünïcode"), "caf-n-code")
+
+    def test_sanitize_name_empty(self):
+        """Names with no valid characters fall back to a default."""
+        self.assertEqual(sanitize_name("///"), "container")
+        self.assertEqual(sanitize_name(""), "container")
+
+
+class TestFallbackYamlDump(unittest.TestCase):
+
+    def test_nested_document(self):
+        """Nested dicts and lists are emitted in order with two-space indents."""
+        doc = {
+            "kind": "Deployment",
+            "spec": {
+                "containers": [{"name": "app", "args": ["a", "b"]}],
+                "replicas": 1,
+            },
+        }
+        expected = "\n".join([
+            "kind: Deployment",
+            "spec:",
+            "  containers:",
+            "    -",
+            "      name: app",
+            "      args:",
+            "        - a",
+            "        - b",
+            "  replicas: 1",
+        ])
+        self.assertEqual(_fallback_yaml_dump(doc), expected)
+
+
+class TestBuildK8sDocuments(unittest.TestCase):
+
+    def test_manifest(self):
+        """A container with env, mounts and ports yields a Deployment and Service."""
+        documents = build_k8s_documents(CONTAINER_DETAILS, "prod")
+        self.assertEqual([doc["kind"] for doc in documents], ["Deployment", "Service"])
+        self.assertEqual(dump_yaml(documents), EXPECTED_MANIFEST)
+
+    def test_stream_yaml_matches_dump_yaml(self):
+        """Streaming the documents produces the same text as dump_yaml."""
+        documents = build_k8s_documents(CONTAINER_DETAILS, "prod")
+        stream = io.StringIO()
+        stream_yaml(documents, stream)
+        self.assertEqual(stream.getvalue(), EXPECTED_MANIFEST + "\n")
+
+    def test_minimal_container(self):
+        """Optional container fields are omitted when absent."""
+        documents = build_k8s_documents({"Name": "/bare", "Config": {"Image": "busybox"}}, "default")
+        self.assertEqual(len(documents), 1)
+        self.assertEqual(documents[0]["spec"]["template"]["spec"], {
+            "containers": [{"name": "bare", "image": "busybox"}],
+        })
+
+    def test_null_sections(self):
+        """Sections Docker reports as null are treated as empty."""
+        documents = build_k8s_documents(
+            {"Name": "/bare", "Config": None, "Mounts": None, "NetworkSettings": None},
+            "default",
+        )
+        self.assertEqual(len(documents), 1)
+        self.assertEqual(documents[0]["spec"]["template"]["spec"], {
+            "containers": [{"name": "bare", "image": "image:latest"}],
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()